@@ -24,6 +24,7 @@ import collections.abc
 import functools
 import re
 import sys
+import types
 from typing import *
 
 from edb.common import debug
@@ -110,7 +111,43 @@ else:
     _check_type = _check_type_passthrough
 
 
+def _resolve_annotations(cls):
+    globalns = sys.modules[cls.__module__].__dict__.copy()
+    globalns[cls.__name__] = cls
+
+    try:
+        while True:
+            try:
+                annos = get_type_hints(cls, globalns)
+            except NameError as e:
+                # Forward type declaration.  Generally, we try
+                # to avoid these as much as possible, but when
+                # there's a cycle it's better to have correct
+                # static type analysis even though the runtime
+                # validation infrastructure does not support
+                # cyclic rerefences.
+                # XXX: This is a horrible hack, need to find
+                # a better way.
+                m = re.match(r"name '(\w+)' is not defined", e.args[0])
+                if not m:
+                    raise
+                globalns[m.group(1)] = AST
+            else:
+                break
+
+    except Exception:
+        raise RuntimeError(
+            f'unable to resolve type annotations for '
+            f'{cls.__module__}.{cls.__qualname__}')
+
+    return annos
+
+
 class AST:
+    # Empty slots allow SlotsASTMeta hierarchies to avoid per-instance
+    # __dict__; regular subclasses still get one.
+    __slots__ = ()
+
     # These use type comments because type annotations are interpreted
     # by the AST system and so annotating them would interfere!
     __ast_frozen_fields__ = frozenset()  # type: AbstractSet[str]
@@ -124,38 +161,20 @@ class AST:
         if '__annotations__' not in dct:
             return cls
 
-        globalns = sys.modules[cls.__module__].__dict__.copy()
-        globalns[cls.__name__] = cls
-
-        try:
-            while True:
-                try:
-                    annos = get_type_hints(cls, globalns)
-                except NameError as e:
-                    # Forward type declaration.  Generally, we try
-                    # to avoid these as much as possible, but when
-                    # there's a cycle it's better to have correct
-                    # static type analysis even though the runtime
-                    # validation infrastructure does not support
-                    # cyclic rerefences.
-                    # XXX: This is a horrible hack, need to find
-                    # a better way.
-                    m = re.match(r"name '(\w+)' is not defined", e.args[0])
-                    if not m:
-                        raise
-                    globalns[m.group(1)] = AST
-                else:
-                    break
-
-        except Exception:
-            raise RuntimeError(
-                f'unable to resolve type annotations for '
-                f'{cls.__module__}.{cls.__qualname__}')
+        if _check_type is not _check_type_real:
+            # Field types are only consulted by the runtime type checks,
+            # don't pay for resolving the annotations otherwise.
+            annos = dct['__annotations__']
+        else:
+            annos = _resolve_annotations(cls)
 
         if annos:
             annos = {k: v for k, v in annos.items()
                      if k in dct['__annotations__']}
 
+            # SlotsASTMeta moves defaults out of the class namespace.
+            defaults = dct.get('__ast_defaults__', dct)
+
             hidden = ()
             if '__ast_hidden__' in dct:
                 hidden = set(dct['__ast_hidden__'])
@@ -170,12 +189,13 @@ class AST:
                     f_type = None
 
                 factory = None
-                if f_name in dct:
-                    f_default = dct[f_name]
+                if f_name in defaults:
+                    f_default = defaults[f_name]
                     if isinstance(f_default, _FieldSpec):
                         factory = f_default.factory
                         f_default = None
-                        delattr(cls, f_name)
+                        if defaults is dct:
+                            delattr(cls, f_name)
                 else:
                     f_default = None
 
@@ -203,11 +223,20 @@ class AST:
                 fields[field.name] = field
 
         cls._fields = fields
+        # Names of the fields that tree walks descend into.
+        cls._walk_fields = tuple(
+            k for k, v in fields.items() if not v.hidden and not v.meta
+        )
         cls._field_factories = tuple(
             (k, v.factory) for k, v in fields.items()
             if v.factory and not isinstance(getattr(cls, k, None), property)
         )
 
+        if isinstance(cls, SlotsASTMeta):
+            # Defaults are assigned by the generated __init__, class
+            # attributes would shadow the slot descriptors.
+            return
+
         # Push the default values down in the MRO
         for k, v in cls._fields.items():
             if (
@@ -256,6 +285,8 @@ class AST:
         copied = copy.copy(self)
         for field, value in changes.items():
             object.__setattr__(copied, field, value)
+        if changes and hasattr(copied, '__post_init__'):
+            copied.__post_init__()
         return copied
 
     def _checked_setattr(self, name, value):
@@ -283,6 +314,8 @@ class AST:
 
 
 class ImmutableASTMixin:
+    __slots__ = ()
+
     __frozen = False
     # This uses type comments because type annotations are interpreted
     # by the AST system and so annotating them would interfere!
@@ -301,6 +334,215 @@ class ImmutableASTMixin:
             else:
                 super().__setattr__(name, value)
 
+    def __setstate__(self, state):
+        # Unpickling assigns slot values with setattr() on an object
+        # whose frozen flag slot is still empty, bypass __setattr__.
+        if isinstance(state, tuple):
+            state, slotstate = state
+        else:
+            slotstate = None
+        if state:
+            self.__dict__.update(state)
+        if slotstate:
+            for name, value in slotstate.items():
+                object.__setattr__(self, name, value)
+
+
+_FROZEN_SLOT = '_ImmutableASTMixin__frozen'
+
+
+class SlotsASTMeta(type):
+    """Metaclass for AST hierarchies that keep node fields in __slots__.
+
+    Abstract nodes get empty slots, so that they can be freely combined
+    with other abstract nodes; every concrete node declares slots for all
+    of its fields not already stored by a concrete ancestor.  Field
+    defaults are moved out of the class namespace (they would clash with
+    the slot descriptors) and a keyword-only __init__ assigning every
+    slot directly is generated for each class, in the same fashion as
+    the dataclasses module does it.  If the class defines
+    ``__post_init__``, it is called once all fields are set.
+
+    Additional non-field slots (e.g. ``__weakref__``) can be requested
+    with ``__ast_extra_slots__``.  Fields listed in
+    ``__ast_required_fields__`` (inherited by subclasses) have no default
+    and must always be passed to the constructor; passing None for them
+    is rejected unless Python runs with -O.
+    """
+
+    def __new__(mcls, name, bases, dct, **kwargs):
+        if not bases or not issubclass(bases[0], (AST, ImmutableASTMixin)):
+            # A foreign class using an AST node as a mixin
+            # (e.g. an astmatch adapter).
+            return super().__new__(mcls, name, bases, dct, **kwargs)
+
+        annos = dct.get('__annotations__', {})
+        dct['__ast_defaults__'] = {
+            f_name: dct.pop(f_name) for f_name in annos if f_name in dct
+        }
+
+        if '__slots__' not in dct:
+            if dct.get('__abstract_node__'):
+                dct['__slots__'] = ()
+            else:
+                dct['__slots__'] = mcls._compute_slots(bases, dct)
+            dct['__slots__'] += tuple(dct.get('__ast_extra_slots__', ()))
+
+        cls = super().__new__(mcls, name, bases, dct, **kwargs)
+
+        if '__init__' not in dct:
+            if cls.__abstract_node__:
+                cls.__init__ = _abstract_init
+            else:
+                cls.__init__ = _make_slots_init(cls)
+
+        return cls
+
+    @staticmethod
+    def _compute_slots(bases, dct):
+        fields = {}
+        existing = set()
+        immutable = False
+
+        for base in bases:
+            for parent in reversed(base.__mro__):
+                existing.update(parent.__dict__.get('__slots__', ()))
+                if parent is ImmutableASTMixin:
+                    immutable = True
+                if issubclass(parent, AST):
+                    fields.update(
+                        dict.fromkeys(
+                            parent.__dict__.get('__annotations__', {})))
+
+        fields.update(dict.fromkeys(dct.get('__annotations__', {})))
+
+        slots = [
+            f for f in fields
+            if f not in existing and not isinstance(dct.get(f), property)
+        ]
+        if immutable and _FROZEN_SLOT not in existing:
+            slots.append(_FROZEN_SLOT)
+
+        return tuple(slots)
+
+
+def _abstract_init(self, **kwargs):
+    raise ASTError(
+        f'cannot instantiate abstract AST node '
+        f'{self.__class__.__name__!r}')
+
+
+def _make_slots_init(cls):
+    fields = [
+        f for f in cls._fields.values()
+        if not isinstance(getattr(cls, f.name, None), property)
+    ]
+    immutable = issubclass(cls, ImmutableASTMixin)
+    post_init = hasattr(cls, '__post_init__')
+    required = getattr(cls, '__ast_required_fields__', frozenset())
+
+    if __debug__ and _check_type is _check_type_real:
+        return _make_checked_slots_init(
+            cls, fields, immutable, post_init, required)
+
+    ns = {'_MISSING': _marker, '_setattr': object.__setattr__}
+    args = []
+    body = []
+    checks = []
+
+    for f in fields:
+        if f.name in required:
+            args.append(f.name)
+            value = f.name
+            msg = f'cannot create {cls.__name__} with {f.name} set to None'
+            checks.append(f'if {f.name} is None: raise ValueError({msg!r})')
+        elif f.factory is not None:
+            ns[f'_factory_{f.name}'] = f.factory
+            args.append(f'{f.name}=_MISSING')
+            value = (
+                f'_factory_{f.name}() if {f.name} is _MISSING else {f.name}'
+            )
+        else:
+            ns[f'_default_{f.name}'] = f.default
+            args.append(f'{f.name}=_default_{f.name}')
+            value = f.name
+
+        if immutable:
+            # ImmutableASTMixin.__setattr__ would reject these.
+            body.append(_immutable_set(cls, f.name, value, ns))
+        else:
+            body.append(f'self.{f.name} = {value}')
+
+    if checks:
+        # The compiler drops the whole block under -O.
+        body[:0] = ['if __debug__:'] + [f'    {c}' for c in checks]
+    if post_init:
+        body.append('self.__post_init__()')
+    if immutable:
+        body.append(_immutable_set(cls, _FROZEN_SLOT, 'True', ns))
+    if not body:
+        body.append('pass')
+
+    sig = f'self, *, {", ".join(args)}' if args else 'self'
+    src = f'def __init__({sig}):\n' + ''.join(f'    {b}\n' for b in body)
+    exec(src, ns)
+
+    init = ns['__init__']
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    init.__module__ = cls.__module__
+    return init
+
+
+def _immutable_set(cls, name, value, ns):
+    # Storing through the slot descriptor directly is about twice as
+    # fast as going through object.__setattr__.
+    descr = getattr(cls, name, None)
+    if isinstance(descr, types.MemberDescriptorType):
+        ns[f'_set_{name}'] = descr.__set__
+        return f'_set_{name}(self, {value})'
+    else:
+        return f'_setattr(self, {name!r}, {value})'
+
+
+def _make_checked_slots_init(cls, fields, immutable, post_init, required):
+    # Debug variant: validate the passed values like AST.__init__ does.
+    def __init__(self, **kwargs):
+        missing = [f for f in required if f not in kwargs]
+        if missing:
+            raise TypeError(
+                f'{cls.__name__}.__init__() missing required keyword '
+                f'arguments: {", ".join(sorted(missing))}')
+
+        for f in required:
+            if kwargs[f] is None:
+                raise ValueError(
+                    f'cannot create {cls.__name__} with {f} set to None')
+
+        for k, v in kwargs.items():
+            field = cls._fields.get(k)
+            if field is None:
+                raise TypeError(
+                    f'{cls.__name__}.__init__() got an unexpected '
+                    f'keyword argument {k!r}')
+            self.check_field_type(field, v)
+
+        for f in fields:
+            if f.name in kwargs:
+                value = kwargs[f.name]
+            elif f.factory is not None:
+                value = f.factory()
+            else:
+                value = f.default
+            object.__setattr__(self, f.name, value)
+
+        if post_init:
+            self.__post_init__()
+        if immutable:
+            object.__setattr__(self, _FROZEN_SLOT, True)
+
+    __init__.__qualname__ = f'{cls.__qualname__}.__init__'
+    return __init__
+
 
 @markup.serializer.serializer.register(AST)
 def serialize_to_markup(ast, *, ctx):
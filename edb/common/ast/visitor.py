@@ -70,12 +70,12 @@ def find_children(
         except SkipNode:
             return False
 
-        for field, value in base.iter_fields(node, include_meta=False):
-            field_spec = node._fields[field]
-            if field_spec.hidden or field_spec.name in extra_skips:
+        for field in node._walk_fields:
+            if field in extra_skips:
                 continue
 
-            if _find_children(value):
+            value = getattr(node, field, None)
+            if value is not None and _find_children(value):
                 return True
 
         return False
@@ -77,7 +77,7 @@ def compile_cast(
         # Ditto for empty arrays.
         new_typeref = typegen.type_to_typeref(new_stype, ctx.env)
         return setgen.ensure_set(
-            irast.Array(elements=[], typeref=new_typeref), ctx=ctx)
+            irast.Array(elements=(), typeref=new_typeref), ctx=ctx)
 
     ir_set = setgen.ensure_set(ir_expr, ctx=ctx)
     orig_stype = setgen.get_set_type(ir_set, ctx=ctx)
@@ -437,7 +437,7 @@ def _find_cast(
         else:
             return None
 
-    dummy_set = irast.EmptySet()  # type: ignore
+    dummy_set = irast.PLACEHOLDER_SET
     args = [
         (orig_stype, dummy_set),
         (new_stype, dummy_set),
@@ -923,7 +923,7 @@ def _cast_array_literal(
         casted_els.append(el)
 
     new_array = setgen.ensure_set(
-        irast.Array(elements=casted_els, typeref=intermediate_typeref),
+        irast.Array(elements=tuple(casted_els), typeref=intermediate_typeref),
         ctx=ctx)
 
     if direct_cast is not None:
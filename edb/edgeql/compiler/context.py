@@ -49,6 +49,7 @@ from edb.schema import types as s_types
 from .options import GlobalCompilerOptions
 
 if TYPE_CHECKING:
+    from edb.schema import expr as s_expr
     from edb.schema import objtypes as s_objtypes
     from edb.schema import sources as s_sources
 
@@ -89,6 +90,26 @@ class ScopeInfo:
     pinned_path_id_ns: Optional[FrozenSet[str]] = None
 
 
+class FunctionInfo(NamedTuple):
+    """Schema-derived data of a function, as used by FunctionCall."""
+
+    shortname: s_name.QualName
+    backend_name: Optional[uuid.UUID]
+    polymorphic: bool
+    sql_function: Optional[str]
+    sql_expr: bool
+    force_return_cast: bool
+    volatility: qltypes.Volatility
+    sql_func_has_out_params: bool
+    error_on_null_result: Optional[str]
+    preserves_optionality: bool
+    preserves_upper_cardinality: bool
+    return_typemod: qltypes.TypeModifier
+    impl_is_strict: bool
+    variadic_param_type: Optional[irast.TypeRef]
+    initial_value: Optional[s_expr.Expression]
+
+
 class PointerRefCache(Dict[irtyputils.PtrRefCacheKey, irast.BasePointerRef]):
 
     _rcache: Dict[irast.BasePointerRef, s_pointers.PointerLike]
@@ -268,8 +289,13 @@ class Environment:
     ]
     """Type cache for shape expressions."""
 
+    func_info_cache: Dict[s_func.Function, FunctionInfo]
+    """Schema-derived data of the functions called in the query."""
+
     path_scope_map: Dict[irast.Set, ScopeInfo]
-    """A dictionary of scope info that are appropriate for a given view."""
+    """A dictionary of scope info that are appropriate for a given view.
+
+    Keyed by Set identity: IR nodes use the default object hash."""
 
     def __init__(
         self,
@@ -319,6 +345,7 @@ class Environment:
         self.type_rewrites = {}
         self.shape_type_cache = {}
         self.expr_view_cache = {}
+        self.func_info_cache = {}
         self.path_scope_map = {}
 
     def add_schema_ref(
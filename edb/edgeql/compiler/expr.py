@@ -268,7 +268,7 @@ def compile_BaseConstant(
         ctx.env.get_track_schema_type(std_type),
         env=ctx.env,
     )
-    return setgen.ensure_set(node_cls(value=value, typeref=ct), ctx=ctx)
+    return setgen.ensure_set(node_cls.get(value=value, typeref=ct), ctx=ctx)
 
 
 def try_fold_binop(
@@ -323,14 +323,16 @@ def try_fold_associative_binop(
             try:
                 new_const = ireval.evaluate(
                     irast.OperatorCall(
-                        args=[
+                        args=(
                             irast.CallArg(
                                 expr=other_const,
+                                param_typemod=opcall.args[0].param_typemod,
                             ),
                             irast.CallArg(
                                 expr=my_const,
+                                param_typemod=opcall.args[1].param_typemod,
                             ),
-                        ],
+                        ),
                         func_shortname=op,
                         func_polymorphic=opcall.func_polymorphic,
                         sql_function=opcall.sql_function,
@@ -338,7 +340,6 @@ def try_fold_associative_binop(
                         sql_operator=opcall.sql_operator,
                         force_return_cast=opcall.force_return_cast,
                         operator_kind=opcall.operator_kind,
-                        params_typemods=opcall.params_typemods,
                         context=opcall.context,
                         typeref=opcall.typeref,
                         typemod=opcall.typemod,
@@ -351,14 +352,16 @@ def try_fold_associative_binop(
                 pass
             else:
                 folded_binop = irast.OperatorCall(
-                    args=[
+                    args=(
                         irast.CallArg(
                             expr=setgen.ensure_set(new_const, ctx=ctx),
+                            param_typemod=opcall.args[0].param_typemod,
                         ),
                         irast.CallArg(
                             expr=other_binop_node,
+                            param_typemod=opcall.args[1].param_typemod,
                         ),
-                    ],
+                    ),
                     func_shortname=op,
                     func_polymorphic=opcall.func_polymorphic,
                     sql_function=opcall.sql_function,
@@ -366,7 +369,6 @@ def try_fold_associative_binop(
                     sql_operator=opcall.sql_operator,
                     force_return_cast=opcall.force_return_cast,
                     operator_kind=opcall.operator_kind,
-                    params_typemods=opcall.params_typemods,
                     context=opcall.context,
                     typeref=opcall.typeref,
                     typemod=opcall.typemod,
@@ -535,7 +537,7 @@ def compile_TypeCast(
 
     if (isinstance(expr.expr, qlast.Array) and not expr.expr.elements and
             irtyputils.is_array(target_typeref)):
-        ir_expr = irast.Array(elements=[], typeref=target_typeref)
+        ir_expr = irast.Array(elements=(), typeref=target_typeref)
 
     elif isinstance(expr.expr, qlast.Parameter):
         pt = typegen.ql_typeexpr_to_type(expr.type, ctx=ctx)
@@ -187,30 +187,12 @@ def compile_FunctionCall(
             )
 
     assert isinstance(func, s_func.Function)
-    func_name = func.get_shortname(env.schema)
+    finfo = get_function_info(func, ctx=ctx)
 
-    matched_func_params = func.get_params(env.schema)
-    variadic_param = matched_func_params.find_variadic(env.schema)
-    variadic_param_type = None
-    if variadic_param is not None:
-        variadic_param_type = typegen.type_to_typeref(
-            variadic_param.get_type(env.schema),
-            env=env,
-        )
-
-    matched_func_ret_type = func.get_return_type(env.schema)
-    is_polymorphic = (
-        any(p.get_type(env.schema).is_polymorphic(env.schema)
-            for p in matched_func_params.objects(env.schema)) and
-        matched_func_ret_type.is_polymorphic(env.schema)
-    )
-
-    matched_func_initial_value = func.get_initial_value(env.schema)
-
-    final_args, params_typemods = finalize_args(
+    final_args = finalize_args(
         matched_call,
         guessed_typemods=typemods,
-        is_polymorphic=is_polymorphic,
+        is_polymorphic=finfo.polymorphic,
         ctx=ctx,
     )
 
@@ -222,8 +204,8 @@ def compile_FunctionCall(
 
     func_initial_value: Optional[irast.Set]
 
-    if matched_func_initial_value is not None:
-        frag = qlparser.parse_fragment(matched_func_initial_value.text)
+    if finfo.initial_value is not None:
+        frag = qlparser.parse_fragment(finfo.initial_value.text)
         assert isinstance(frag, qlast.Expr)
         iv_ql = qlast.TypeCast(
             expr=frag,
@@ -259,38 +241,100 @@ def compile_FunctionCall(
 
     global_args = get_globals(expr, matched_call, candidates=funcs, ctx=ctx)
 
+    extras = None
+    if (
+        func_initial_value is not None
+        or matched_call.has_empty_variadic
+        or finfo.error_on_null_result is not None
+        or finfo.variadic_param_type is not None
+        or global_args
+    ):
+        extras = irast.FunctionCallExtras(
+            func_initial_value=func_initial_value,
+            has_empty_variadic=matched_call.has_empty_variadic,
+            error_on_null_result=finfo.error_on_null_result,
+            variadic_param_type=finfo.variadic_param_type,
+            global_args=global_args,
+        )
+
     fcall = irast.FunctionCall(
         args=final_args,
-        func_shortname=func_name,
-        backend_name=func.get_backend_name(env.schema),
-        func_polymorphic=is_polymorphic,
-        func_sql_function=func.get_from_function(env.schema),
-        func_sql_expr=func.get_from_expr(env.schema),
-        force_return_cast=func.get_force_return_cast(env.schema),
-        volatility=func.get_volatility(env.schema),
-        sql_func_has_out_params=func.get_sql_func_has_out_params(env.schema),
-        error_on_null_result=func.get_error_on_null_result(env.schema),
-        preserves_optionality=func.get_preserves_optionality(env.schema),
-        preserves_upper_cardinality=func.get_preserves_upper_cardinality(
-            env.schema),
-        params_typemods=params_typemods,
+        func_shortname=finfo.shortname,
+        backend_name=finfo.backend_name,
+        func_polymorphic=finfo.polymorphic,
+        func_sql_function=finfo.sql_function,
+        func_sql_expr=finfo.sql_expr,
+        force_return_cast=finfo.force_return_cast,
+        volatility=finfo.volatility,
+        sql_func_has_out_params=finfo.sql_func_has_out_params,
+        preserves_optionality=finfo.preserves_optionality,
+        preserves_upper_cardinality=finfo.preserves_upper_cardinality,
         context=expr.context,
         typeref=typegen.type_to_typeref(
             rtype, env=env,
         ),
-        typemod=matched_call.func.get_return_typemod(env.schema),
-        has_empty_variadic=matched_call.has_empty_variadic,
-        variadic_param_type=variadic_param_type,
-        func_initial_value=func_initial_value,
-        tuple_path_ids=tuple_path_ids,
-        impl_is_strict=func.get_impl_is_strict(env.schema),
-        global_args=global_args,
+        typemod=finfo.return_typemod,
+        tuple_path_ids=tuple(tuple_path_ids),
+        impl_is_strict=finfo.impl_is_strict,
+        extras=extras,
     )
 
     ir_set = setgen.ensure_set(fcall, typehint=rtype, path_id=path_id, ctx=ctx)
     return stmt.maybe_add_view(ir_set, ctx=ctx)
 
 
+def get_function_info(
+    func: s_func.Function, *,
+    ctx: context.ContextLevel,
+) -> context.FunctionInfo:
+    """Return the schema-derived data of *func* needed by FunctionCall.
+
+    The same handful of functions is typically called many times in a
+    query, so the result is cached in the compiler environment.
+    """
+    env = ctx.env
+    finfo = env.func_info_cache.get(func)
+    if finfo is not None:
+        return finfo
+
+    schema = env.schema
+    params = func.get_params(schema)
+    variadic_param = params.find_variadic(schema)
+    variadic_param_type = None
+    if variadic_param is not None:
+        variadic_param_type = typegen.type_to_typeref(
+            variadic_param.get_type(schema),
+            env=env,
+        )
+
+    is_polymorphic = (
+        any(p.get_type(schema).is_polymorphic(schema)
+            for p in params.objects(schema)) and
+        func.get_return_type(schema).is_polymorphic(schema)
+    )
+
+    finfo = context.FunctionInfo(
+        shortname=func.get_shortname(schema),
+        backend_name=func.get_backend_name(schema),
+        polymorphic=is_polymorphic,
+        sql_function=func.get_from_function(schema),
+        sql_expr=func.get_from_expr(schema),
+        force_return_cast=func.get_force_return_cast(schema),
+        volatility=func.get_volatility(schema),
+        sql_func_has_out_params=func.get_sql_func_has_out_params(schema),
+        error_on_null_result=func.get_error_on_null_result(schema),
+        preserves_optionality=func.get_preserves_optionality(schema),
+        preserves_upper_cardinality=func.get_preserves_upper_cardinality(
+            schema),
+        return_typemod=func.get_return_typemod(schema),
+        impl_is_strict=func.get_impl_is_strict(schema),
+        variadic_param_type=variadic_param_type,
+        initial_value=func.get_initial_value(schema),
+    )
+    env.func_info_cache[func] = finfo
+    return finfo
+
+
 #: A dictionary of conditional callables and the indices
 #: of the arguments that are evaluated conditionally.
 CONDITIONAL_OPS = {
@@ -529,7 +573,7 @@ def compile_operator(
         matched_rtype.is_polymorphic(env.schema)
     )
 
-    final_args, params_typemods = finalize_args(
+    final_args = finalize_args(
         matched_call,
         actual_typemods=actual_typemods,
         guessed_typemods=typemods,
@@ -586,11 +630,10 @@ def compile_operator(
         force_return_cast=oper.get_force_return_cast(env.schema),
         volatility=oper.get_volatility(env.schema),
         operator_kind=oper.get_operator_kind(env.schema),
-        params_typemods=params_typemods,
         context=qlexpr.context,
         typeref=typegen.type_to_typeref(rtype, env=env),
         typemod=oper.get_return_typemod(env.schema),
-        tuple_path_ids=[],
+        tuple_path_ids=(),
         impl_is_strict=oper.get_impl_is_strict(env.schema),
     )
 
@@ -746,10 +789,9 @@ def finalize_args(
     guessed_typemods: Dict[Union[int, str], ft.TypeModifier],
     is_polymorphic: bool = False,
     ctx: context.ContextLevel,
-) -> Tuple[List[irast.CallArg], List[ft.TypeModifier]]:
+) -> Tuple[irast.CallArg, ...]:
 
     args: List[irast.CallArg] = []
-    typemods = []
 
     for i, barg in enumerate(bound_call.args):
         param = barg.param
@@ -757,8 +799,8 @@ def finalize_args(
         arg_type_path_id: Optional[irast.PathId] = None
         if param is None:
             # defaults bitmask
-            args.append(irast.CallArg(expr=arg))
-            typemods.append(ft.TypeModifier.SingletonType)
+            args.append(irast.CallArg(
+                expr=arg, param_typemod=ft.TypeModifier.SingletonType))
             continue
 
         if actual_typemods:
@@ -766,8 +808,6 @@ def finalize_args(
         else:
             param_mod = param.get_typemod(ctx.env.schema)
 
-        typemods.append(param_mod)
-
         if param_mod is not ft.TypeModifier.SetOfType:
             param_shortname = param.get_parameter_name(ctx.env.schema)
 
@@ -862,6 +902,7 @@ def finalize_args(
 
         args.append(
             irast.CallArg(expr=arg, expr_type_path_id=arg_type_path_id,
-                          is_default=barg.is_default))
+                          is_default=barg.is_default,
+                          param_typemod=param_mod))
 
-    return args, typemods
+    return tuple(args)
@@ -687,11 +687,11 @@ def __infer_func_call(
         # of declaration.
         arg_cards = []
 
-        for arg, typemod in zip(ir.args, ir.params_typemods):
+        for arg in ir.args:
             arg.cardinality = infer_cardinality(
                 arg.expr, scope_tree=scope_tree, ctx=ctx)
 
-            if typemod is not qltypes.TypeModifier.OptionalType:
+            if arg.param_typemod is not qltypes.TypeModifier.OptionalType:
                 arg_cards.append(arg.cardinality)
 
         arg_card = zip(*(_card_to_bounds(card) for card in arg_cards))
@@ -722,7 +722,8 @@ def __infer_func_call(
         singleton_arg_cards = []
         all_singletons = True
 
-        for arg, typemod in zip(ir.args, ir.params_typemods):
+        for arg in ir.args:
+            typemod = arg.param_typemod
             arg.cardinality = infer_cardinality(
                 arg.expr, scope_tree=scope_tree, ctx=ctx)
             if typemod is not qltypes.TypeModifier.SetOfType:
@@ -788,7 +789,8 @@ def __infer_oper_call(
             args = [a.expr for a in ir.args]
         else:
             all_optional = True
-            for arg, typemod in zip(ir.args, ir.params_typemods):
+            for arg in ir.args:
+                typemod = arg.param_typemod
                 if typemod is not qltypes.TypeModifier.SetOfType:
                     all_optional &= (
                         typemod is qltypes.TypeModifier.OptionalType
@@ -166,11 +166,11 @@ def new_set_from_set(
         path_id = path_id.merge_namespace(ctx.path_id_namespace)
     if stype is None:
         stype = get_set_type(ir_set, ctx=ctx)
-    if path_scope_id == KeepCurrent:
+    if path_scope_id is KeepCurrent:
         path_scope_id = ir_set.path_scope_id
-    if rptr == KeepCurrent:
+    if rptr is KeepCurrent:
         rptr = ir_set.rptr
-    if expr == KeepCurrent:
+    if expr is KeepCurrent:
         expr = ir_set.expr
     if context is None:
         context = ir_set.context
@@ -202,12 +202,13 @@ def new_set_from_set(
 
 
 def new_tuple_set(
-        elements: List[irast.TupleElement], *,
+        elements: Sequence[irast.TupleElement], *,
         named: bool,
         ctx: context.ContextLevel) -> irast.Set:
 
     dummy_typeref = cast(irast.TypeRef, None)
-    tup = irast.Tuple(elements=elements, named=named, typeref=dummy_typeref)
+    tup = irast.Tuple(
+        elements=tuple(elements), named=named, typeref=dummy_typeref)
     stype = inference.infer_type(tup, env=ctx.env)
     result_path_id = pathctx.get_expression_path_id(stype, ctx=ctx)
 
@@ -223,7 +224,8 @@ def new_tuple_set(
         ))
 
     typeref = typegen.type_to_typeref(stype, env=ctx.env)
-    final_tup = irast.Tuple(elements=final_elems, named=named, typeref=typeref)
+    final_tup = irast.Tuple(
+        elements=tuple(final_elems), named=named, typeref=typeref)
     return ensure_set(final_tup, path_id=result_path_id,
                       type_override=stype, ctx=ctx)
 
@@ -233,6 +235,7 @@ def new_array_set(
         ctx: context.ContextLevel,
         srcctx: Optional[parsing.ParserContext]=None) -> irast.Set:
 
+    elements = tuple(elements)
     dummy_typeref = cast(irast.TypeRef, None)
     arr = irast.Array(elements=elements, typeref=dummy_typeref)
     if elements:
@@ -1035,7 +1038,7 @@ def enum_indirection_set(
     )
 
     return casts.compile_cast(
-        irast.StringConstant(value=ptr_name, typeref=strref),
+        irast.StringConstant.get(value=ptr_name, typeref=strref),
         source,
         srcctx=source_context,
         ctx=ctx,
@@ -1107,7 +1110,7 @@ def type_intersection_set(
                 rptr_specialization.append(component)
             elif stype.issubclass(ctx.env.schema, component_endpoint):
                 assert isinstance(stype, s_objtypes.ObjectType)
-                if rptr.direction is s_pointers.PointerDirection.Inbound:
+                if rptr.is_inbound:
                     # assert isinstance(component, irast.PointerRef)
                     # rptr_specialization.append(component)
 
@@ -1757,8 +1760,8 @@ def should_materialize(
         reasons.append(irast.MaterializeVisible(
             sets=vis, path_scope_id=ir.path_scope_id))
 
-    if ptrcls and ptrcls in ctx.env.source_map:
-        reasons += ctx.env.source_map[ptrcls].should_materialize
+    if ptrcls and (comp_info := ctx.env.source_map.get(ptrcls)):
+        reasons += comp_info.should_materialize
 
     for r in should_materialize_type(typ, ctx=ctx):
         # Rewrite visibility reasons from the typ to reflect this,
@@ -1781,8 +1784,8 @@ def should_materialize_type(
     if isinstance(
             typ, (s_objtypes.ObjectType, s_pointers.Pointer)):
         for pointer in typ.get_pointers(schema).objects(schema):
-            if pointer in ctx.env.source_map:
-                reasons += ctx.env.source_map[pointer].should_materialize
+            if (comp_info := ctx.env.source_map.get(pointer)):
+                reasons += comp_info.should_materialize
     elif isinstance(typ, s_types.Collection):
         for sub in typ.get_subtypes(schema):
             reasons += should_materialize_type(sub, ctx=ctx)
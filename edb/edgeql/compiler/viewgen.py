@@ -345,8 +345,8 @@ def _process_view(
     # all of the rptrs to properly point back at ir_set.
     for _, ptrcls, shape_op, ptr_set in shape_ptrs:
         srcctx = None
-        if ptrcls in ctx.env.pointer_specified_info:
-            _, _, srcctx = ctx.env.pointer_specified_info[ptrcls]
+        if (spec_info := ctx.env.pointer_specified_info.get(ptrcls)):
+            _, _, srcctx = spec_info
 
         if ptr_set:
             src_path_id = path_id
@@ -1547,8 +1547,8 @@ def _late_compile_view_shapes_in_set(
         shape = []
         for path_tip, ptr, shape_op, _ in shape_ptrs:
             srcctx = None
-            if ptr in ctx.env.pointer_specified_info:
-                _, _, srcctx = ctx.env.pointer_specified_info[ptr]
+            if (spec_info := ctx.env.pointer_specified_info.get(ptr)):
+                _, _, srcctx = spec_info
 
             element = setgen.extend_path(
                 path_tip,
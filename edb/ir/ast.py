@@ -68,6 +68,7 @@ from __future__ import annotations
 import dataclasses
 import typing
 import uuid
+import weakref
 
 from edb.common import ast, compiler, parsing, markup, enum as s_enum
 
@@ -89,16 +90,21 @@ def new_scope_tree() -> ScopeTreeNode:
     return ScopeTreeNode(fenced=True)
 
 
-class Base(ast.AST):
+class Base(ast.AST, metaclass=ast.SlotsASTMeta):
     __abstract_node__ = True
     __ast_hidden__ = {'context'}
 
     context: typing.Optional[parsing.ParserContext] = None
 
+    # Leading part of __repr__, baked in for every subclass.
+    _repr_prefix = '<ir.Base at 0x'
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = f'<ir.{cls.__name__} at 0x'
+
     def __repr__(self) -> str:
-        return (
-            f'<ir.{self.__class__.__name__} at 0x{id(self):x}>'
-        )
+        return f'{self._repr_prefix}{id(self):x}>'
 
 
 class ImmutableBase(ast.ImmutableASTMixin, Base):
@@ -114,6 +120,7 @@ class TypeRef(ImmutableBase):
     # Hide ancestors and children from debug spew because they are
     # incredibly noisy.
     __ast_hidden__ = {'ancestors', 'children'}
+    __ast_extra_slots__ = ('__weakref__',)
 
     # The id of the referenced type
     id: uuid.UUID
@@ -181,6 +188,49 @@ class TypeRef(ImmutableBase):
         return hash(self.id)
 
 
+_interned_typerefs: weakref.WeakValueDictionary[typing.Any, TypeRef] = (
+    weakref.WeakValueDictionary())
+
+_P = typing.ParamSpec('_P')
+TypeRef_T = typing.TypeVar('TypeRef_T', bound=TypeRef)
+
+
+def intern_typeref(
+    cls: typing.Callable[_P, TypeRef_T],
+    /,
+    *args: _P.args,
+    **kwargs: _P.kwargs,
+) -> TypeRef_T:
+    """Return an interned *cls* instance with the given field values.
+
+    TypeRefs are immutable, so a single instance can be shared by
+    every compilation that describes the same type the same way.
+    Nested TypeRefs are compared by identity: the interned instance
+    keeps them alive, so their ids are stable for as long as the
+    entry exists.  The arguments are checked statically against the
+    *cls* constructor.
+    """
+    assert not args, 'TypeRef fields are keyword-only'
+    key = (cls, tuple(
+        (k, _typeref_intern_key(v)) for k, v in sorted(kwargs.items())
+    ))
+    try:
+        return typing.cast(TypeRef_T, _interned_typerefs[key])
+    except KeyError:
+        result = cls(**kwargs)
+        _interned_typerefs[key] = result
+        return result
+
+
+def _typeref_intern_key(v: typing.Any) -> typing.Any:
+    if isinstance(v, TypeRef):
+        return id(v)
+    elif type(v) is frozenset or type(v) is tuple:
+        return type(v)(map(_typeref_intern_key, v))
+    else:
+        return v
+
+
 class AnyTypeRef(TypeRef):
     pass
 
@@ -419,6 +469,7 @@ class TypeIntersectionPointerRef(BasePointerRef):
 
 
 class Pointer(Base):
+    __ast_hidden__ = {'is_inbound'}
 
     source: Set
     target: Set
@@ -427,10 +478,13 @@ class Pointer(Base):
     is_definition: bool
     anchor: typing.Optional[str] = None
     show_as_anchor: typing.Optional[str] = None
+    # Derived from direction once, as it is checked a lot during
+    # compilation.  The direction is not changed after construction.
+    is_inbound: bool = False
 
-    @property
-    def is_inbound(self) -> bool:
-        return self.direction == s_pointers.PointerDirection.Inbound
+    def __post_init__(self) -> None:
+        self.is_inbound = (
+            self.direction == s_pointers.PointerDirection.Inbound)
 
     @property
     def dir_cardinality(self) -> qltypes.Cardinality:
@@ -471,6 +525,8 @@ class BindingKind(s_enum.StrEnum):
 class Set(Base):
 
     __ast_frozen_fields__ = frozenset({'typeref'})
+    __ast_hidden__ = {'_repr_cache'}
+    __ast_meta__ = {'_repr_cache'}
 
     # N.B: Make sure to add new fields to setgen.new_set_from_set!
 
@@ -501,8 +557,15 @@ class Set(Base):
     # insertions to BaseObject.
     ignore_rewrites: bool = False
 
+    # The last path_id rendered by __repr__ together with its string
+    # form; formatting a PathId is fairly expensive.
+    _repr_cache: typing.Optional[typing.Tuple[PathId, str]] = None
+
     def __repr__(self) -> str:
-        return f'<ir.Set \'{self.path_id}\' at 0x{id(self):x}>'
+        cache = self._repr_cache
+        if cache is None or cache[0] is not self.path_id:
+            cache = self._repr_cache = (self.path_id, str(self.path_id))
+        return f'<ir.Set \'{cache[1]}\' at 0x{id(self):x}>'
 
 
 class Command(Base):
@@ -699,21 +762,46 @@ class EmptySet(Set, ConstExpr):
     pass
 
 
+# A shared data-less EmptySet for places that need *some* Set but never
+# look at it (unfilled statement fields, dummy call arguments).  Real
+# empty sets are created by setgen.new_empty_set() with their own path_id.
+PLACEHOLDER_SET: Set = EmptySet()  # type: ignore
+
+
+BaseConstant_T = typing.TypeVar('BaseConstant_T', bound='BaseConstant')
+
+
 class BaseConstant(ConstExpr, ImmutableExpr):
     __abstract_node__ = True
+    __ast_required_fields__ = frozenset(('typeref', 'value'))
+    __ast_extra_slots__ = ('__weakref__',)
     value: typing.Any
 
-    def __init__(
-        self,
-        *args: typing.Any,
+    @classmethod
+    def get(
+        cls: typing.Type[BaseConstant_T],
+        *,
+        value: typing.Any,
         typeref: TypeRef,
-        **kwargs: typing.Any,
-    ) -> None:
-        super().__init__(*args, typeref=typeref, **kwargs)
-        if self.typeref is None:
-            raise ValueError('cannot create irast.Constant without a type')
-        if self.value is None:
-            raise ValueError('cannot create irast.Constant without a value')
+    ) -> BaseConstant_T:
+        """Return an interned constant of this class.
+
+        Queries tend to repeat the same literals (0, 1, true, '', ...),
+        and constants are immutable, so equal ones can share a node.
+        The interned node keeps *typeref* alive, so its id is a stable
+        key for as long as the entry exists.
+        """
+        key = (cls, value, id(typeref))
+        try:
+            return typing.cast(BaseConstant_T, _interned_constants[key])
+        except KeyError:
+            result = cls(value=value, typeref=typeref)
+            _interned_constants[key] = result
+            return result
+
+
+_interned_constants: weakref.WeakValueDictionary[
+    typing.Any, BaseConstant] = weakref.WeakValueDictionary()
 
 
 class BaseStrConstant(BaseConstant):
@@ -779,13 +867,13 @@ class TupleElement(ImmutableBase):
 class Tuple(ImmutableExpr):
 
     named: bool = False
-    elements: typing.List[TupleElement]
+    elements: typing.Tuple[TupleElement, ...]
     typeref: TypeRef
 
 
 class Array(ImmutableExpr):
 
-    elements: typing.Sequence[Set]
+    elements: typing.Tuple[Set, ...]
     typeref: TypeRef
 
 
@@ -816,6 +904,9 @@ class CallArg(ImmutableBase):
     cardinality: qltypes.Cardinality = qltypes.Cardinality.UNKNOWN
     multiplicity: qltypes.Multiplicity = qltypes.Multiplicity.UNKNOWN
     is_default: bool = False
+    # Typemod of the parameter this argument is bound to.
+    param_typemod: qltypes.TypeModifier = (
+        qltypes.TypeModifier.SingletonType)
 
 
 class Call(ImmutableExpr):
@@ -836,12 +927,9 @@ class Call(ImmutableExpr):
     # explicitly cast into the declared function return type.
     force_return_cast: bool
 
-    # Bound arguments.
-    args: typing.List[CallArg]
-
-    # Typemods of parameters.  This list corresponds to ".args"
-    # (so `zip(args, params_typemods)` is valid.)
-    params_typemods: typing.List[qltypes.TypeModifier]
+    # Bound arguments.  Each argument carries the typemod of
+    # the parameter it is bound to in ".param_typemod".
+    args: typing.Tuple[CallArg, ...]
 
     # Return type and typemod.  In bodies of polymorphic functions
     # the return type can be polymorphic; in queries the return
@@ -851,7 +939,7 @@ class Call(ImmutableExpr):
 
     # If the return type is a tuple, this will contain a list
     # of tuple element path ids relative to the call set.
-    tuple_path_ids: typing.List[PathId]
+    tuple_path_ids: typing.Tuple[PathId, ...]
 
     # Volatility of the function or operator.
     volatility: qltypes.Volatility
@@ -862,11 +950,13 @@ class Call(ImmutableExpr):
     impl_is_strict: bool = False
 
 
-class FunctionCall(Call):
+class FunctionCallExtras(ImmutableBase):
+    """Rarely set attributes of a FunctionCall.
 
-    # If the bound callable is a "USING SQL" callable, this
-    # attribute will be set to the name of the SQL function.
-    func_sql_function: typing.Optional[str]
+    Most function calls leave all of these at their defaults, so they
+    are kept out of the FunctionCall node itself and only allocated
+    when needed.
+    """
 
     # initial value needed for aggregate function calls to correctly
     # handle empty set
@@ -876,15 +966,29 @@ class FunctionCall(Call):
     # there are no arguments that are bound to it.
     has_empty_variadic: bool = False
 
+    # Error to raise if the underlying SQL function returns NULL.
+    error_on_null_result: typing.Optional[str] = None
+
+    # Set to the type of the variadic parameter of the bound function
+    # (or None, if the function has no variadic parameters.)
+    variadic_param_type: typing.Optional[TypeRef] = None
+
+    # Additional arguments representing global variables
+    global_args: typing.Optional[typing.List[Set]] = None
+
+
+class FunctionCall(Call):
+
+    # If the bound callable is a "USING SQL" callable, this
+    # attribute will be set to the name of the SQL function.
+    func_sql_function: typing.Optional[str]
+
     # The underlying SQL function has OUT parameters.
     sql_func_has_out_params: bool = False
 
     # backend_name for the underlying function
     backend_name: typing.Optional[uuid.UUID] = None
 
-    # Error to raise if the underlying SQL function returns NULL.
-    error_on_null_result: typing.Optional[str] = None
-
     # Whether the generic function preserves optionality of the generic
     # argument(s).
     preserves_optionality: bool = False
@@ -893,12 +997,33 @@ class FunctionCall(Call):
     # argument(s).
     preserves_upper_cardinality: bool = False
 
-    # Set to the type of the variadic parameter of the bound function
-    # (or None, if the function has no variadic parameters.)
-    variadic_param_type: typing.Optional[TypeRef] = None
+    # Rarely used attributes, None if they are all at their defaults.
+    extras: typing.Optional[FunctionCallExtras] = None
 
-    # Additional arguments representing global variables
-    global_args: typing.Optional[typing.List[Set]] = None
+    @property
+    def func_initial_value(self) -> typing.Optional[Set]:
+        extras = self.extras
+        return extras.func_initial_value if extras is not None else None
+
+    @property
+    def has_empty_variadic(self) -> bool:
+        extras = self.extras
+        return extras.has_empty_variadic if extras is not None else False
+
+    @property
+    def error_on_null_result(self) -> typing.Optional[str]:
+        extras = self.extras
+        return extras.error_on_null_result if extras is not None else None
+
+    @property
+    def variadic_param_type(self) -> typing.Optional[TypeRef]:
+        extras = self.extras
+        return extras.variadic_param_type if extras is not None else None
+
+    @property
+    def global_args(self) -> typing.Optional[typing.List[Set]]:
+        extras = self.extras
+        return extras.global_args if extras is not None else None
 
 
 class OperatorCall(Call):
@@ -987,7 +1112,7 @@ class Stmt(Expr):
     # Parts of the edgeql->IR compiler need to create statements and fill in
     # the result later, but making it Optional would cause lots of errors,
     # so we stick a bogus Empty set in.
-    result: Set = EmptySet()  # type: ignore
+    result: Set = PLACEHOLDER_SET
     parent_stmt: typing.Optional[Stmt] = None
     iterator_stmt: typing.Optional[Set] = None
     bindings: typing.Optional[typing.List[Set]] = None
@@ -1008,12 +1133,12 @@ class SelectStmt(FilteredStmt):
 
 
 class GroupStmt(FilteredStmt):
-    subject: Set = EmptySet()  # type: ignore
+    subject: Set = PLACEHOLDER_SET
     using: typing.Dict[str, typing.Tuple[Set, qltypes.Cardinality]] = (
         ast.field(factory=dict))
     by: typing.List[qlast.GroupingElement]
-    result: Set = EmptySet()  # type: ignore
-    group_binding: Set = EmptySet()  # type: ignore
+    result: Set = PLACEHOLDER_SET
+    group_binding: Set = PLACEHOLDER_SET
     grouping_binding: typing.Optional[Set] = None
     orderby: typing.Optional[typing.List[SortExpr]] = None
     # Optimization information
@@ -1027,7 +1152,7 @@ class MutatingStmt(Stmt):
     # Parts of the edgeql->IR compiler need to create statements and fill in
     # the subject later, but making it Optional would cause lots of errors,
     # so we stick a bogus Empty set in.
-    subject: Set = EmptySet()  # type: ignore
+    subject: Set = PLACEHOLDER_SET
     # Conflict checks that we should manually raise constraint violations
     # for.
     conflict_checks: typing.Optional[typing.List[OnConflictClause]] = None
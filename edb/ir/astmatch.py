@@ -27,9 +27,13 @@ from edb.common.ast import match as astmatch
 from . import ast as irast
 
 
+class MatchASTMeta(astmatch.MatchASTMeta, ast.SlotsASTMeta):
+    pass
+
+
 for name, cls in irast.__dict__.items():
     if isinstance(cls, type) and issubclass(cls, ast.AST):
-        adapter = astmatch.MatchASTMeta(
+        adapter = MatchASTMeta(
             name, (astmatch.MatchASTNode,),
             {'__module__': __name__}, adapts=cls)
         setattr(sys.modules[__name__], name, adapter)
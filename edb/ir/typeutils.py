@@ -232,12 +232,14 @@ def type_to_typeref(
                 return cached_result
 
     if t.is_anytuple(schema):
-        result = irast.AnyTupleRef(
+        result = irast.intern_typeref(
+            irast.AnyTupleRef,
             id=t.id,
             name_hint=typename or t.get_name(schema),
         )
     elif t.is_any(schema):
-        result = irast.AnyTypeRef(
+        result = irast.intern_typeref(
+            irast.AnyTypeRef,
             id=t.id,
             name_hint=typename or t.get_name(schema),
         )
@@ -323,7 +325,8 @@ def type_to_typeref(
         else:
             ancestors = None
 
-        result = irast.TypeRef(
+        result = irast.intern_typeref(
+            irast.TypeRef,
             id=t.id,
             name_hint=name,
             material_type=material_typeref,
@@ -347,7 +350,8 @@ def type_to_typeref(
         else:
             material_typeref = None
 
-        result = irast.TypeRef(
+        result = irast.intern_typeref(
+            irast.TypeRef,
             id=t.id,
             name_hint=typename or t.get_name(schema),
             material_type=material_typeref,
@@ -369,7 +373,8 @@ def type_to_typeref(
         else:
             material_typeref = None
 
-        result = irast.TypeRef(
+        result = irast.intern_typeref(
+            irast.TypeRef,
             id=t.id,
             name_hint=typename or t.get_name(schema),
             material_type=material_typeref,
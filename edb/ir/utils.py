@@ -448,6 +448,6 @@ def find_potentially_visible(
 
 
 def contains_set_of_op(ir: irast.Base) -> bool:
-    flt = (lambda n: any(x == ft.TypeModifier.SetOfType
-                         for x in n.params_typemods))
+    flt = (lambda n: any(x.param_typemod == ft.TypeModifier.SetOfType
+                         for x in n.args))
     return bool(ast.find_children(ir, irast.Call, flt, terminate_early=True))
@@ -80,10 +80,15 @@ def compile_ir_to_sql_tree(
         else:
             scope_tree = irast.new_scope_tree()
 
-        scope_tree_nodes = {
-            node.unique_id: node for node in scope_tree.descendants
-            if node.unique_id is not None
-        }
+        # Scope ids come from a counter, so a list indexed by
+        # the id is a dense and cheap-to-index mapping.
+        scope_tree_nodes: List[Optional[irast.ScopeTreeNode]] = []
+        for node in scope_tree.descendants:
+            if node.unique_id is not None:
+                if node.unique_id >= len(scope_tree_nodes):
+                    scope_tree_nodes.extend(
+                        [None] * (node.unique_id + 1 - len(scope_tree_nodes)))
+                scope_tree_nodes[node.unique_id] = node
 
         if backend_runtime_params is None:
             backend_runtime_params = pgparams.get_default_runtime_params()
@@ -384,7 +384,8 @@ class Environment:
     singleton_mode: bool
     query_params: List[irast.Param]
     type_rewrites: Dict[RewriteKey, irast.Set]
-    scope_tree_nodes: Dict[int, irast.ScopeTreeNode]
+    # Scope tree nodes indexed by their unique_id (path_scope_id).
+    scope_tree_nodes: List[Optional[irast.ScopeTreeNode]]
     external_rvars: Mapping[Tuple[irast.PathId, str], pgast.PathRangeVar]
     materialized_views: Dict[uuid.UUID, irast.Set]
     backend_runtime_params: pgparams.BackendRuntimeParams
@@ -405,7 +406,7 @@ class Environment:
         explicit_top_cast: Optional[irast.TypeRef],
         query_params: List[irast.Param],
         type_rewrites: Dict[RewriteKey, irast.Set],
-        scope_tree_nodes: Dict[int, irast.ScopeTreeNode],
+        scope_tree_nodes: List[Optional[irast.ScopeTreeNode]],
         external_rvars: Optional[
             Mapping[Tuple[irast.PathId, str], pgast.PathRangeVar]
         ] = None,
@@ -365,12 +365,12 @@ def _compile_call_args(
     if isinstance(expr, irast.FunctionCall) and expr.global_args:
         args += [dispatch.compile(arg, ctx=ctx) for arg in expr.global_args]
     args += [dispatch.compile(a.expr, ctx=ctx) for a in expr.args]
-    for ref, ir_arg, typemod in zip(args, expr.args, expr.params_typemods):
+    for ref, ir_arg in zip(args, expr.args):
         if (
             not expr.impl_is_strict
             and ir_arg.cardinality.can_be_zero()
             and ref.nullable
-            and typemod == ql_ft.TypeModifier.SingletonType
+            and ir_arg.param_typemod == ql_ft.TypeModifier.SingletonType
         ):
             raise errors.UnsupportedFeatureError(
                 'operations on potentially empty arguments not supported in '
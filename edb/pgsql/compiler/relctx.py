@@ -35,7 +35,6 @@ from edb.ir import ast as irast
 from edb.ir import typeutils as irtyputils
 from edb.ir import utils as irutils
 
-from edb.schema import pointers as s_pointers
 from edb.schema import name as sn
 
 from edb.pgsql import ast as pgast
@@ -582,9 +581,7 @@ def _new_inline_pointer_rvar(
     ptr_rvar = rvar_for_rel(ptr_rel, lateral=lateral, ctx=ctx)
     ptr_rvar.query.path_id = ir_ptr.target.path_id.ptr_path()
 
-    is_inbound = ir_ptr.direction == s_pointers.PointerDirection.Inbound
-
-    if is_inbound:
+    if ir_ptr.is_inbound:
         far_pid = ir_ptr.source.path_id
     else:
         far_pid = ir_ptr.target.path_id
@@ -615,7 +612,7 @@ def _new_mapped_pointer_rvar(
 
     # Set up references according to the link direction.
     if (
-        ir_ptr.direction == s_pointers.PointerDirection.Inbound
+        ir_ptr.is_inbound
         or ptrref.computed_backlink
     ):
         near_ref = target_ref
@@ -760,8 +757,9 @@ def get_scope(
 
     result: Optional[irast.ScopeTreeNode] = None
 
-    if ir_set.path_scope_id is not None:
-        result = ctx.env.scope_tree_nodes.get(ir_set.path_scope_id)
+    psid = ir_set.path_scope_id
+    if psid is not None and psid < len(ctx.env.scope_tree_nodes):
+        result = ctx.env.scope_tree_nodes[psid]
 
     return result
 
@@ -1022,8 +1020,9 @@ def unpack_var(
                 packed=False, multi=False, ref=None
             ))
 
-        elif path_id.target.id in ctx.env.materialized_views:
-            view_tuple = ctx.env.materialized_views[path_id.target.id]
+        elif (
+            view_tuple := ctx.env.materialized_views.get(path_id.target.id)
+        ):
 
             vpath_ids = []
             id_idx = None
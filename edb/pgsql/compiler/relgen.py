@@ -353,8 +353,8 @@ def _get_set_rvar(
                 return process_set_as_oper_expr(ir_set, ctx=ctx)
 
             if any(
-                pm is qltypes.TypeModifier.SetOfType
-                for pm in expr.params_typemods
+                arg.param_typemod is qltypes.TypeModifier.SetOfType
+                for arg in expr.args
             ):
                 # Call to an aggregate function.
                 return process_set_as_agg_expr(ir_set, ctx=ctx)
@@ -3102,8 +3102,9 @@ def _compile_call_args(
             arg_ref = dispatch.compile(glob_arg, ctx=ctx)
             args.append(output.output_as_value(arg_ref, env=ctx.env))
 
-    for ir_arg, typemod in zip(expr.args, expr.params_typemods):
+    for ir_arg in expr.args:
         assert ir_arg.multiplicity != qltypes.Multiplicity.UNKNOWN
+        typemod = ir_arg.param_typemod
 
         arg_ref = dispatch.compile(ir_arg.expr, ctx=ctx)
         args.append(output.output_as_value(arg_ref, env=ctx.env))
@@ -3272,9 +3273,9 @@ def process_set_as_agg_expr_inner(
 
             args = []
 
-            for i, (ir_call_arg, typemod) in enumerate(
-                    zip(expr.args, expr.params_typemods)):
+            for i, ir_call_arg in enumerate(expr.args):
                 ir_arg = ir_call_arg.expr
+                typemod = ir_call_arg.param_typemod
 
                 arg_ref: pgast.BaseExpr
                 if for_group_by:
@@ -20,6 +20,7 @@
 
 
 import copy
+import pickle
 import typing
 import unittest
 import unittest.mock
@@ -51,6 +52,17 @@ class tast:
         value: typing.Any = None
 
 
+class tslots:
+    # Module-level, so that instances can be pickled.
+
+    class Base(ast.AST, metaclass=ast.SlotsASTMeta):
+        __abstract_node__ = True
+
+    class Frozen(ast.ImmutableASTMixin, Base):
+        value: typing.Any = None
+        items: typing.Tuple[int, ...] = ()
+
+
 class tastmatch:
 
     for name, cls in tast.__dict__.items():
@@ -181,6 +193,120 @@ class ASTBaseTests(unittest.TestCase):
         self.assertEqual(Node().field1, None)
         self.assertEqual(Node().field3, 123)
 
+    def test_common_ast_slots(self):
+        class Base(ast.AST, metaclass=ast.SlotsASTMeta):
+            __abstract_node__ = True
+            context: typing.Any = None
+
+        class Expr(Base):
+            __abstract_node__ = True
+            typeref: typing.Any = None
+
+        class Immutable(ast.ImmutableASTMixin, Base):
+            __abstract_node__ = True
+
+        class Node(Base):
+            field: typing.Any = 123
+            items: typing.List[int] = ast.field(factory=list)
+
+        class SubNode(Node, Expr):
+            field: typing.Any = 456
+
+        class Frozen(Expr, Immutable):
+            value: typing.Any
+
+        node = Node(items=[1])
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertEqual(node.field, 123)
+        self.assertIsNone(node.context)
+        self.assertEqual(node.items, [1])
+        self.assertIsNot(Node().items, Node().items)
+
+        subnode = SubNode(typeref='int')
+        self.assertFalse(hasattr(subnode, '__dict__'))
+        self.assertEqual(subnode.field, 456)
+        self.assertEqual(subnode.typeref, 'int')
+
+        copied = copy.copy(subnode)
+        self.assertIsNot(copied, subnode)
+        self.assertEqual(copied.typeref, 'int')
+
+        frozen = Frozen(value=1)
+        self.assertFalse(hasattr(frozen, '__dict__'))
+        with self.assertRaises(TypeError):
+            frozen.value = 2
+
+        with self.assertRaises(TypeError):
+            Node(unknown=1)
+
+        with self.assertRaisesRegex(ast.ASTError, 'abstract'):
+            Expr()
+
+        pickled = pickle.loads(pickle.dumps(
+            tslots.Frozen(value='foo', items=(1, 2))))
+        self.assertEqual(pickled.value, 'foo')
+        self.assertEqual(pickled.items, (1, 2))
+        with self.assertRaises(TypeError):
+            pickled.value = 'bar'
+
+    def test_common_ast_slots_post_init(self):
+        class Base(ast.AST, metaclass=ast.SlotsASTMeta):
+            __abstract_node__ = True
+
+        class Node(Base):
+            value: int = 0
+            double: int = 0
+
+            def __post_init__(self):
+                self.double = self.value * 2
+
+        self.assertEqual(Node(value=2).double, 4)
+        self.assertEqual(Node(value=2).replace(value=3).double, 6)
+
+    def test_common_ast_slots_required(self):
+        class Base(ast.AST, metaclass=ast.SlotsASTMeta):
+            __abstract_node__ = True
+            __ast_required_fields__ = frozenset(('value',))
+            value: int
+            extra: int = 0
+
+        class Node(Base):
+            pass
+
+        class Frozen(ast.ImmutableASTMixin, Base):
+            pass
+
+        self.assertEqual(Node(value=1).value, 1)
+        self.assertEqual(Node(value=1).extra, 0)
+        with self.assertRaisesRegex(TypeError, 'value'):
+            Node(extra=1)
+
+        # None is rejected outside of type checking mode too.
+        if __debug__:
+            with self.assertRaisesRegex(ValueError, 'value set to None'):
+                Node(value=None)
+            with self.assertRaisesRegex(ValueError, 'value set to None'):
+                Frozen(value=None)
+
+    @unittest.mock.patch(
+        'edb.common.ast.base._check_type',
+        ast.base._check_type_real,
+    )
+    def test_common_ast_slots_required_checked(self):
+        class Base(ast.AST, metaclass=ast.SlotsASTMeta):
+            __abstract_node__ = True
+            __ast_required_fields__ = frozenset(('value',))
+            value: typing.Optional[int]
+
+        class Node(Base):
+            pass
+
+        self.assertEqual(Node(value=1).value, 1)
+        with self.assertRaisesRegex(TypeError, 'value'):
+            Node()
+        with self.assertRaisesRegex(ValueError, 'value set to None'):
+            Node(value=None)
+
 
 class ASTMatchTests(unittest.TestCase):
     tree1 = tast.BinOp(
@@ -0,0 +1,132 @@
+#
+# This source file is part of the EdgeDB open source project.
+#
+# Copyright 2012-present MagicStack Inc. and the EdgeDB authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import gc
+import unittest
+import uuid
+import weakref
+
+from edb.ir import ast as irast
+from edb.ir import pathid
+from edb.schema import name as s_name
+
+
+def _typeref(name='std::str', **kwargs):
+    return irast.intern_typeref(
+        irast.TypeRef,
+        id=uuid.uuid5(uuid.NAMESPACE_OID, name),
+        name_hint=s_name.QualName(*name.split('::')),
+        **kwargs,
+    )
+
+
+class TestEdgeQLIRAst(unittest.TestCase):
+    """Unit tests for IR node helpers."""
+
+    def test_edgeql_ir_typeref_intern_01(self):
+        str_t = _typeref('std::str')
+        self.assertIs(str_t, _typeref('std::str'))
+        self.assertIs(
+            _typeref('std::str', is_scalar=True),
+            _typeref('std::str', is_scalar=True),
+        )
+        self.assertIsNot(str_t, _typeref('std::str', is_scalar=True))
+
+    def test_edgeql_ir_typeref_intern_02(self):
+        str_t = _typeref('std::str')
+        int_t = _typeref('std::int64')
+
+        arr_str = _typeref('default::StrArray', subtypes=(str_t,))
+        self.assertIs(
+            arr_str, _typeref('default::StrArray', subtypes=(str_t,)))
+        self.assertIsNot(
+            arr_str, _typeref('default::StrArray', subtypes=(int_t,)))
+
+        renamed = irast.intern_typeref(
+            irast.TypeRef,
+            id=str_t.id,
+            name_hint=s_name.QualName('default', 'str_alias'),
+        )
+        self.assertIsNot(str_t, renamed)
+        self.assertEqual(renamed.name_hint.name, 'str_alias')
+
+        self.assertIsNot(
+            str_t,
+            irast.intern_typeref(
+                irast.AnyTypeRef, id=str_t.id, name_hint=str_t.name_hint),
+        )
+
+    def test_edgeql_ir_typeref_intern_03(self):
+        typeref = _typeref('default::Transient')
+        ref = weakref.ref(typeref)
+
+        del typeref
+        gc.collect()
+        # The intern table must not keep otherwise unused nodes alive.
+        self.assertIsNone(ref())
+
+    def test_edgeql_ir_identity_hash(self):
+        # IR nodes key hot compiler maps such as env.path_scope_map
+        # and must keep the cheap identity-based hash and equality.
+        typeref = _typeref('default::Object')
+        path_id = pathid.PathId.from_typeref(typeref)
+
+        a = irast.Set(path_id=path_id, typeref=typeref)
+        b = irast.Set(path_id=path_id, typeref=typeref)
+        self.assertNotEqual(a, b)
+        self.assertEqual(hash(a), object.__hash__(a))
+        self.assertNotIn(b, {a: 1})
+
+        arg_a = irast.CallArg(expr=a)
+        arg_b = irast.CallArg(expr=a)
+        self.assertNotEqual(arg_a, arg_b)
+        self.assertEqual(hash(arg_a), object.__hash__(arg_a))
+        self.assertNotIn(arg_b, {arg_a: 1})
+
+    def test_edgeql_ir_constant_intern_01(self):
+        str_t = _typeref('std::str')
+        const = irast.StringConstant.get(value='1', typeref=str_t)
+        self.assertIs(
+            const, irast.StringConstant.get(value='1', typeref=str_t))
+        self.assertEqual(const.value, '1')
+        self.assertIs(const.typeref, str_t)
+
+    def test_edgeql_ir_constant_intern_02(self):
+        str_t = _typeref('std::str')
+        const = irast.StringConstant.get(value='1', typeref=str_t)
+
+        int_t = _typeref('std::int64')
+        int_const = irast.IntegerConstant.get(value='1', typeref=int_t)
+        self.assertIsNot(const, int_const)
+        self.assertIsInstance(int_const, irast.IntegerConstant)
+
+        other_t = _typeref('default::str_alias')
+        self.assertIsNot(
+            const, irast.StringConstant.get(value='1', typeref=other_t))
+        self.assertIsNot(
+            const, irast.StringConstant.get(value='2', typeref=str_t))
+
+    def test_edgeql_ir_constant_intern_03(self):
+        str_t = _typeref('std::str')
+        with self.assertRaises(TypeError):
+            irast.StringConstant.get(value='1')
+        with self.assertRaises(TypeError):
+            irast.StringConstant.get(typeref=str_t)
+        with self.assertRaises(TypeError):
+            irast.StringConstant.get('1', str_t)